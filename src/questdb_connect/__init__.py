@@ -8,7 +8,11 @@ from questdb_connect.compilers import QDBDDLCompiler, QDBSQLCompiler
 from questdb_connect.dialect import QuestDBDialect, connection_uri, create_engine
 from questdb_connect.identifier_preparer import QDBIdentifierPreparer
 from questdb_connect.inspector import QDBInspector
-from questdb_connect.keywords_functions import get_functions_list, get_keywords_list
+from questdb_connect.keywords_functions import (
+    get_functions_list,
+    get_keywords_list,
+    initialize_catalog,
+)
 from questdb_connect.table_engine import QDBTableEngine
 from questdb_connect.types import (
     QUESTDB_TYPES,
@@ -44,8 +48,10 @@ from questdb_connect.types import (
 # microseconds. QuestDB does not store time zone information alongside timestamp values
 # and therefore it should be assumed that all timestamps are in UTC.
 if hasattr(time, "tzset"):
-    os.environ["TZ"] = "UTC"
-    time.tzset()
+    # tzset reparses the zone, skip it when UTC is already in effect
+    if os.environ.get("TZ") != "UTC" or time.tzname != ("UTC", "UTC"):
+        os.environ["TZ"] = "UTC"
+        time.tzset()
 
 # ===== DBAPI =====
 # https://peps.python.org/pep-0249/
@@ -55,35 +61,41 @@ threadsafety = 2
 paramstyle = "pyformat"
 
 
+_CONNECT_DEFAULTS = {
+    "host": "127.0.0.1",
+    "port": 8812,
+    "user": "admin",
+    "password": "quest",
+    "database": "main",
+}
+# SQLAlchemy passes "user"/"database", direct callers of connect() may also
+# use "username", or "dbname" as libpq names it
+_CONNECT_ALIASES = {"username": "user", "dbname": "database"}
+
+
 class Error(Exception):
     pass
 
 
 class Cursor(psycopg2.extensions.cursor):
-    def execute(self, query, vars=None):
-        """execute(query, vars=None) -- Execute query with bound vars."""
-        return super().execute(remove_public_schema(query), vars)
+    __slots__ = ()
 
+    # bound once so execute does not build a super() proxy per call
+    _parent_execute = psycopg2.extensions.cursor.execute
 
-def cursor_factory(*args, **kwargs):
-    return Cursor(*args, **kwargs)
+    def execute(self, query, vars=None):
+        """execute(query, vars=None) -- Execute query with bound vars."""
+        return Cursor._parent_execute(self, remove_public_schema(query), vars)
 
 
 def connect(**kwargs):
-    host = kwargs.get("host") or "127.0.0.1"
-    port = kwargs.get("port") or 8812
-    user = kwargs.get("username") or "admin"
-    password = kwargs.get("password") or "quest"
-    database = kwargs.get("database") or "main"
-    conn = psycopg2.connect(
-        cursor_factory=cursor_factory,
-        host=host,
-        port=port,
-        user=user,
-        password=password,
-        database=database,
+    params = _CONNECT_DEFAULTS.copy()
+    params.update(
+        (_CONNECT_ALIASES.get(name, name), value)
+        for name, value in kwargs.items()
+        if value is not None
     )
+    conn = psycopg2.connect(cursor_factory=Cursor, **params)
     # retrieve and cache function names and keywords lists
-    get_keywords_list(conn)
-    get_functions_list(conn)
+    initialize_catalog(conn)
     return conn
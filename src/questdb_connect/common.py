@@ -1,5 +1,5 @@
+import collections
 import enum
-import re
 
 
 class PartitionBy(enum.Enum):
@@ -12,9 +12,52 @@ class PartitionBy(enum.Enum):
 
 
 def remove_public_schema(query):
-    if query and isinstance(query, str) and "public" in query:
-        return re.sub(_PUBLIC_SCHEMA_FILTER, "", query)
-    return query
+    try:
+        if not query or "." not in query:
+            return query
+    except TypeError:
+        return query  # not a str (e.g. bytes), psycopg2 deals with it as is
+    if len(query) >= _REWRITE_CACHE_MAX_QUERY_LEN:
+        return _strip_public_schema(query)
+    rewritten = _REWRITE_CACHE.get(query)
+    if rewritten is None:
+        rewritten = _REWRITE_CACHE[query] = _strip_public_schema(query)
+        if len(_REWRITE_CACHE) > _REWRITE_CACHE_SIZE:
+            _REWRITE_CACHE.popitem(last=False)
+    return rewritten
+
+
+def _strip_public_schema(query):
+    if "p" not in query and "P" not in query:
+        return query
+    if query.islower():
+        lowered = query  # already lowercase, scan it without making a copy
+    else:
+        lowered = query.lower()
+        if len(lowered) != len(query):
+            # some characters expand when lowercased, keep indexes aligned
+            lowered = query.translate(_ASCII_LOWER)
+    find = lowered.find
+    idx = find("public")
+    if idx == -1:
+        return query
+    # str.find runs the substring search in C, the loop only visits candidates
+    parts = []
+    append = parts.append
+    last = 0
+    while idx != -1:
+        end = idx + 6
+        if idx > last and query[idx - 1] == "'" and query[end : end + 2] == "'.":
+            append(query[last : idx - 1])
+            last = end + 2
+        elif query[end : end + 1] == ".":
+            append(query[last:idx])
+            last = end + 1
+        idx = find("public", end)
+    if not parts:
+        return query
+    append(query[last:])
+    return "".join(parts)
 
 
 def quote_identifier(identifier: str):
@@ -29,7 +72,9 @@ def quote_identifier(identifier: str):
     return f'"{identifier[first:last]}"'
 
 
-_PUBLIC_SCHEMA_FILTER = re.compile(
-    r"(')?(public(?(1)\1|)\.)", re.IGNORECASE | re.MULTILINE
-)
+_ASCII_LOWER = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
 _QUOTES = ("'", '"')
+# FIFO memo of rewritten queries, ORMs send the same statement text repeatedly
+_REWRITE_CACHE = collections.OrderedDict()
+_REWRITE_CACHE_SIZE = 1024
+_REWRITE_CACHE_MAX_QUERY_LEN = 4096
@@ -241,11 +241,11 @@ def test_dialect_has_table(test_engine):
 
 def test_functions(test_engine):
     with test_engine.connect() as conn:
-        expected = [row[0] for row in conn.execute("SELECT name FROM functions()").fetchall()]
+        expected = {row[0] for row in conn.execute("SELECT name FROM functions()").fetchall()}
         assert qdbc.get_functions_list() == expected
 
 
 def test_keywords(test_engine):
     with test_engine.connect() as conn:
-        expected = [row[0] for row in conn.execute("SELECT keyword FROM keywords()").fetchall()]
+        expected = {row[0] for row in conn.execute("SELECT keyword FROM keywords()").fetchall()}
         assert qdbc.get_keywords_list() == expected
@@ -0,0 +1,13 @@
+import pytest
+
+
+# Unit tests run without a QuestDB server, these override the autouse fixtures
+# in tests/conftest.py that create tables on the server for every test.
+@pytest.fixture(autouse=True, name='test_model')
+def test_model_fixture():
+    return None
+
+
+@pytest.fixture(autouse=True, name='test_metrics')
+def test_metrics_fixture():
+    return None
@@ -0,0 +1,71 @@
+import random
+import re
+
+import pytest
+from questdb_connect import common
+from questdb_connect.common import remove_public_schema
+
+# the pattern remove_public_schema used to apply, kept as the reference behaviour
+_PUBLIC_SCHEMA_FILTER = re.compile(r"(')?(public(?(1)\1|)\.)", re.IGNORECASE | re.MULTILINE)
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        ("SELECT * FROM public.x", "SELECT * FROM x"),
+        ("SELECT * FROM 'public'.x", "SELECT * FROM x"),
+        ("SELECT * FROM 'public.x'", "SELECT * FROM 'x'"),
+        ("SELECT * FROM republic.x", "SELECT * FROM rex"),
+        # case-insensitive, also when no lowercase "public" occurs in the query
+        ("SELECT * FROM PUBLIC.x", "SELECT * FROM x"),
+        ("SELECT * FROM Public.x", "SELECT * FROM x"),
+        ("SELECT * FROM 'PUBLIC'.x", "SELECT * FROM x"),
+        ("SELECT 'PUBLIC.' FROM x", "SELECT '' FROM x"),
+        ("SELECT * FROM public.public.x", "SELECT * FROM x"),
+        ("SELECT * FROM 'public'.public.x", "SELECT * FROM x"),
+        ("SELECT * FROM public.x JOIN public.y ON x.id = y.id", "SELECT * FROM x JOIN y ON x.id = y.id"),
+        ("SELECT 'İ' FROM public.x", "SELECT 'İ' FROM x"),
+        ("SELECT 'İİ', 'public'.x FROM public.y", "SELECT 'İİ', x FROM y"),
+        ("SELECT * FROM public", "SELECT * FROM public"),
+        ("SELECT 'public' FROM x", "SELECT 'public' FROM x"),
+        ("SELECT * FROM x", "SELECT * FROM x"),
+        ("", ""),
+        (None, None),
+        (b"SELECT * FROM public.x", b"SELECT * FROM public.x"),
+    ],
+)
+def test_remove_public_schema(query, expected):
+    assert remove_public_schema(query) == expected
+
+
+def test_remove_public_schema_matches_regex():
+    tokens = ["public", "PUBLIC", "Public", "pUbLiC", "p", "P", "'", ".", " ", "x", "pub", "lic", "\n", "İ", "ß"]
+    rnd = random.Random(42)
+    for _ in range(20000):
+        query = "".join(rnd.choice(tokens) for _ in range(rnd.randint(1, 12)))
+        assert remove_public_schema(query) == _PUBLIC_SCHEMA_FILTER.sub("", query), query
+
+
+def test_remove_public_schema_memo(monkeypatch):
+    monkeypatch.setattr(common, "_REWRITE_CACHE", type(common._REWRITE_CACHE)())
+    monkeypatch.setattr(common, "_REWRITE_CACHE_SIZE", 2)
+    cache = common._REWRITE_CACHE
+    assert remove_public_schema("SELECT * FROM public.a") == "SELECT * FROM a"
+    assert remove_public_schema("SELECT * FROM public.b") == "SELECT * FROM b"
+    assert list(cache) == ["SELECT * FROM public.a", "SELECT * FROM public.b"]
+
+    # a hit returns the memoized rewrite
+    cache["SELECT * FROM public.a"] = "memoized"
+    assert remove_public_schema("SELECT * FROM public.a") == "memoized"
+
+    # the oldest entry is evicted first
+    assert remove_public_schema("SELECT * FROM public.c") == "SELECT * FROM c"
+    assert list(cache) == ["SELECT * FROM public.b", "SELECT * FROM public.c"]
+    assert remove_public_schema("SELECT * FROM public.a") == "SELECT * FROM a"
+
+    # long queries and queries without a '.' are not memoized
+    long_query = "SELECT * FROM public.x WHERE " + " OR ".join(["a = 1"] * 1000)
+    assert remove_public_schema(long_query) == long_query.replace("public.", "")
+    assert remove_public_schema("SELECT 1") == "SELECT 1"
+    assert long_query not in cache
+    assert "SELECT 1" not in cache
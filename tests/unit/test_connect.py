@@ -0,0 +1,24 @@
+from unittest import mock
+
+import pytest
+import questdb_connect as qdbc
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "expected"),
+    [
+        ({}, {}),
+        ({"username": "joe"}, {"user": "joe"}),
+        ({"user": "joe"}, {"user": "joe"}),
+        ({"database": "other"}, {"database": "other"}),
+        ({"dbname": "other"}, {"database": "other"}),
+        ({"password": ""}, {"password": ""}),
+        ({"host": None, "port": None}, {}),
+        ({"host": "qdb", "port": 9000, "sslmode": "require"}, {"host": "qdb", "port": 9000, "sslmode": "require"}),
+    ],
+)
+def test_connect_params(kwargs, expected):
+    defaults = {"host": "127.0.0.1", "port": 8812, "user": "admin", "password": "quest", "database": "main"}
+    with mock.patch("psycopg2.connect") as pg_connect, mock.patch("questdb_connect.initialize_catalog"):
+        assert qdbc.connect(**kwargs) is pg_connect.return_value
+    pg_connect.assert_called_once_with(cursor_factory=qdbc.Cursor, **{**defaults, **expected})
@@ -0,0 +1,92 @@
+import pytest
+from questdb_connect import keywords_functions as kf
+
+FUNCTIONS = ["abs", "sum"]
+KEYWORDS = ["select", "from"]
+KEYWORDS_STMT = "SELECT keyword FROM keywords()"
+FUNCTIONS_STMT = "SELECT name FROM functions()"
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self._conn = conn
+        self._rows = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        return False
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def execute(self, sql):
+        self._conn.statements.append(sql)
+        if sql in self._conn.failing:
+            raise RuntimeError(f"rejected: {sql}")
+        if sql == KEYWORDS_STMT:
+            self._rows = [(name,) for name in KEYWORDS]
+        elif sql == FUNCTIONS_STMT:
+            self._rows = [(name,) for name in FUNCTIONS]
+        else:
+            self._rows = [("f", name) for name in FUNCTIONS] + [("k", name) for name in KEYWORDS]
+
+
+class FakeConnection:
+    def __init__(self, *failing):
+        self.autocommit = False
+        self.failing = failing
+        self.statements = []
+
+    def cursor(self):
+        return FakeCursor(self)
+
+
+@pytest.fixture(autouse=True)
+def _reset_catalog():
+    kf.__func_names.clear()
+    kf.__keywords.clear()
+    yield
+    kf.__func_names.clear()
+    kf.__keywords.clear()
+
+
+def test_initialize_catalog_single_query():
+    conn = FakeConnection()
+    kf.initialize_catalog(conn)
+    assert conn.statements == [kf._CATALOG_STMT]
+    assert not conn.autocommit
+    assert kf.get_functions_list() == set(FUNCTIONS)
+    assert kf.get_keywords_list() == set(KEYWORDS)
+
+
+def test_initialize_catalog_already_populated():
+    kf.initialize_catalog(FakeConnection())
+    conn = FakeConnection()
+    kf.initialize_catalog(conn)
+    assert conn.statements == []
+
+
+def test_initialize_catalog_retries_per_list():
+    conn = FakeConnection(kf._CATALOG_STMT)
+    kf.initialize_catalog(conn)
+    assert conn.statements == [kf._CATALOG_STMT, KEYWORDS_STMT, FUNCTIONS_STMT]
+    assert not conn.autocommit
+    assert kf.get_functions_list() == set(FUNCTIONS)
+    assert kf.get_keywords_list() == set(KEYWORDS)
+
+
+def test_initialize_catalog_falls_back_to_defaults():
+    conn = FakeConnection(kf._CATALOG_STMT, FUNCTIONS_STMT)
+    kf.initialize_catalog(conn)
+    assert conn.statements == [kf._CATALOG_STMT, KEYWORDS_STMT, FUNCTIONS_STMT]
+    assert kf.get_keywords_list() == set(KEYWORDS)
+    functions = kf.get_functions_list()
+    assert "abs" in functions
+    assert "sysdate" in functions
+
+
+def test_defaults_without_connection():
+    assert "sysdate" in kf.get_functions_list()
+    assert "select" in kf.get_keywords_list()